@@ -14,13 +14,8 @@
 # sys.path.insert(0, os.path.abspath('.'))
 
 import os
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parents[2].absolute()))
-
-# Mock certain imports to prevent import errors during documentation build.
-autodoc_mock_imports = ['tkinter']
 
 # -- Project information -----------------------------------------------------
 
@@ -34,30 +29,20 @@ release = '1.0'
 
 # -- General configuration ---------------------------------------------------
 
-# Default value is "members,undoc-members, show-inheritance". This line supresses
-# document generation for members causing following warning during build:
-#      "WARNING: duplicate object description of XXX, other instance in YYY,
-#      "use :noindex: for one of them"
-os.environ["SPHINX_APIDOC_OPTIONS"] = "members,show-inheritance"
-
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = [
-    'sphinx.ext.autodoc',
+    'autoapi.extension',
     'sphinx.ext.napoleon',
     'sphinx.ext.todo',
     'sphinx.ext.githubpages',
-    'sphinxcontrib.apidoc',
 ]
 
-# Add any paths that contain templates here, relative to this directory.
-templates_path = ['_templates']
-
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-# Note: No effect when using sphinx-apidoc
+# Note: No effect on sources generated by sphinx-autoapi
 exclude_patterns = []
 
 
@@ -78,18 +63,42 @@ html_css_files = [
 ]
 
 html_theme_options = {
-    # navigation entries are expandable – the [+] icons next to each entry
-    "collapse_navigation": False,
+    # only the navigation entries of the current page are expanded; a fully
+    # expanded tree is rendered into every page which slows down the build
+    "collapse_navigation": True,
 
-    # unlimited depth of the table of contents tree (spirent packages has too many levels)
-    "navigation_depth": -1,
+    # bounded depth of the table of contents tree
+    "navigation_depth": 4,
+
+    # do not include headings of pages in the table of contents tree
+    "titles_only": True,
 }
 
-# -- Configuration for sphinxcontrib-apidoc extension ------------------------
+# Fully expanded table of contents tree with unlimited depth (spirent packages
+# has too many levels), e.g. for release builds: SPHINX_FULL_NAV=1 make html
+if os.environ.get("SPHINX_FULL_NAV"):
+    html_theme_options.update(collapse_navigation=False, navigation_depth=-1)
+
+# -- Configuration for sphinx-autoapi extension -----------------------------
 
-apidoc_module_dir = str(Path(__file__).parents[2])
-apidoc_output_dir = str(Path(__file__).parents[0] / 'sources')
-apidoc_excluded_paths = ['framework', 'setup.py']
-apidoc_separate_modules = True
-apidoc_module_first = True
-apidoc_extra_args = ['--no-toc', '-t', str(Path(__file__).parents[0] / '_templates')]
+# Sources are parsed statically, documented packages are not imported
+# during the build (so no imports need to be mocked).
+autoapi_type = 'python'
+autoapi_dirs = [
+    str(Path(__file__).parents[2] / 'lbr_testsuite'),
+    str(Path(__file__).parents[2] / 'pytest_tests'),
+]
+autoapi_file_patterns = ['*.py']
+# Spirentlib server is a standalone script (not a part of the package).
+autoapi_ignore = ['*/framework/*', '*/setup.py', '*/spirentlib/server/*']
+autoapi_root = 'sources'
+autoapi_keep_files = True
+autoapi_generate_api_docs = True
+# Generated documentation is linked from the index.rst toctree.
+autoapi_add_toctree_entry = False
+
+# Default value also contains "private-members", "special-members",
+# "imported-members" and "show-module-summary". These are omitted to prevent
+# generation of duplicate object descriptions. "undoc-members" is required
+# as packages without a docstring would be skipped otherwise.
+autoapi_options = ['members', 'undoc-members', 'show-inheritance']
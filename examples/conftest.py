@@ -9,14 +9,19 @@ Common pytest fixtures and hooks for testsuite examples.
 import logging
 
 
+# Loggers of libraries which are too verbose on lower severities.
+# Level is set on the loggers themselves, so lower severity records are
+# dropped before they are even created.
+RESTRICTED_LOGGERS = (
+    "faker.factory",
+    "matplotlib",
+)
+
+
 def pytest_configure(config):
     """pytest_configure hook is used here to restrict selected loggers
     to higher severity messages only.
     """
 
-    restricted_loggers = [
-        "faker.factory",
-        "matplotlib",
-    ]
-    for rl in restricted_loggers:
+    for rl in RESTRICTED_LOGGERS:
         logging.getLogger(rl).setLevel(logging.WARNING)
@@ -6,8 +6,8 @@ Copyright: (C) 2023 CESNET, z.s.p.o.
 Common functions for charts drawing.
 """
 
+import functools
 import math
-import os
 import pathlib
 
 from pytest_cases import fixture
@@ -15,6 +15,10 @@ from pytest_cases import fixture
 from lbr_testsuite import data_table
 
 
+REFERENCE_RESULTS_DIR = pathlib.Path(__file__).resolve().parent / "reference_results"
+
+
+@functools.cache
 def mbps_to_mpps(thrpt_mbps, pkt_len):
     # Add 24B to packet lenth: 7B preamble + 1B SoF + 4B CRC + 12B minimal IFG
     pps = thrpt_mbps / ((pkt_len + 24) * 8)
@@ -29,12 +33,10 @@ def results_filenames(request, tmp_path_factory):
     """
 
     tmp_path = tmp_path_factory.mktemp("data_table")
-    ref_path = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-    ref_path = ref_path / "reference_results"
     test_name = request.node.name[:-3]  # remove ".py" from test name
 
     test_base = tmp_path / test_name
-    ref_base = ref_path / test_name
+    ref_base = REFERENCE_RESULTS_DIR / test_name
 
     return dict(
         ref_csv=f"{ref_base}.csv",
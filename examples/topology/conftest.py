@@ -81,10 +81,7 @@ def topology_example_topology(
     generator = NetdevGenerator(options[0])
     analyzer = CustomAnalyzer(options[-1])
 
-    devices_address = options[1:-1]
-    devs = []
-    for addr in devices_address:
-        devs.append(PciDevice(addr))
+    devs = [PciDevice(addr) for addr in options[1:-1]]
 
     if len(devs) == 1:
         device = devs[0]
@@ -17,17 +17,55 @@ ds._deimport_completely()
 
 # isort: on
 
-from . import data_table  # noqa
-from . import dpdk_application  # noqa
+import importlib as _importlib
+
+# Subpackages related to TRex (trex, packet_crafter and their dependencies)
+# have to be imported eagerly while TRex versions of Scapy and Yaml are
+# being handled.
+from . import common  # noqa
 from . import executable  # noqa
 from . import ipconfigurer  # noqa
 from . import packet_crafter  # noqa
-from . import profiling  # noqa
-from . import spirent  # noqa
-from . import throughput_runner  # noqa
 from . import topology  # noqa
 from . import trex  # noqa
 from .common import *  # noqa
 
 
 dy._deimport_completely()
+
+
+# Remaining subpackages pull in heavy dependencies (e.g. pandas,
+# matplotlib) and are imported on first access only.
+_LAZY_SUBPACKAGES = (
+    "data_table",
+    "dpdk_application",
+    "profiling",
+    "spirent",
+    "throughput_runner",
+)
+
+
+__all__ = [
+    "common",
+    "executable",
+    "ipconfigurer",
+    "packet_crafter",
+    "topology",
+    "trex",
+    *common.__all__,
+    # Star import triggers the lazy import of these.
+    *_LAZY_SUBPACKAGES,
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBPACKAGES:
+        # import_module() binds the subpackage to this package, so this
+        # hook is not called again for the same name.
+        return _importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_SUBPACKAGES))
@@ -8,6 +8,8 @@ Copyright: (C) 2024 CESNET, z.s.p.o.
 Spirent class fixtures.
 """
 
+import functools
+
 from pytest_cases import fixture
 
 from lbr_testsuite import spirent as lbrt_spirent
@@ -16,6 +18,12 @@ from lbr_testsuite import spirent as lbrt_spirent
 DEFAULT_CONFIG_FILENAME_BASE = "default_config"
 
 
+@functools.cache
+def _resolve_dir(path):
+    # Test modules usually share a few directories, resolve each only once.
+    return path.resolve()
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--spirent-config-mapping",
@@ -36,16 +44,39 @@ def pytest_addoption(parser):
     )
 
 
-@fixture(scope="module")
-def spirent_config_suffix(request, generator):
-    """Fixture providing spirent configuration file suffix based on
-    per-port mapping.
+@fixture(scope="session")
+def spirent_config_mappings(request):
+    """Fixture providing per-port mapping of spirent configuration file
+    suffixes. The mapping is parsed from command line arguments only
+    once per session.
 
     Parameters
     ----------
     request: Fixture
         Special pytest fixture (here for acquiring command line
         arguments).
+
+    Returns
+    -------
+    dict(str, str)
+        Dictionary where keys are spirent ports and values are
+        configuration file suffixes.
+    """
+
+    port_cfg_mappings = request.config.getoption("spirent_config_mapping")
+
+    return dict(mapping.split(",") for mapping in port_cfg_mappings)
+
+
+@fixture(scope="module")
+def spirent_config_suffix(spirent_config_mappings, generator):
+    """Fixture providing spirent configuration file suffix based on
+    per-port mapping.
+
+    Parameters
+    ----------
+    spirent_config_mappings : dict(str, str)
+        Mapping of spirent ports to configuration file suffixes.
     generator : Spirent
         An initialized instance of Spirent generator.
 
@@ -57,16 +88,11 @@ def spirent_config_suffix(request, generator):
 
     assert isinstance(generator, lbrt_spirent.Spirent)
 
-    port_cfg_mappings = request.config.getoption("spirent_config_mapping")
-    port_cfg_mappings = [mapping.split(",") for mapping in port_cfg_mappings]
-    port_cfg_mappings = {port: suffix for port, suffix in port_cfg_mappings}
-
-    spirent_port = generator.get_port()
-    cfg_suffix = ""
-    if port_cfg_mappings.get(spirent_port) is not None:
-        cfg_suffix = f"_{port_cfg_mappings[spirent_port]}"
+    cfg_suffix = spirent_config_mappings.get(generator.get_port())
+    if cfg_suffix is None:
+        return ""
 
-    return cfg_suffix
+    return f"_{cfg_suffix}"
 
 
 @fixture(scope="module")
@@ -89,7 +115,7 @@ def spirent_config_default_dir(request):
         files are stored.
     """
 
-    return request.node.path.parent.resolve()
+    return _resolve_dir(request.node.path.parent)
 
 
 @fixture(scope="module")
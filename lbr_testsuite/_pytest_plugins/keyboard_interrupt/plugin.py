@@ -46,6 +46,26 @@ def pytest_addoption(parser):
     )
 
 
+class _SafeFinalizer:
+    """Finalizer wrapper logging exceptions of the wrapped finalizer
+    instead of raising them when pytest is in "exiting" mode.
+    """
+
+    __slots__ = ("_finalizer",)
+
+    def __init__(self, finalizer):
+        self._finalizer = finalizer
+
+    def __call__(self):
+        try:
+            self._finalizer()
+        except Exception as e:
+            if not keyboard_interrupt:
+                raise
+
+            global_logger.error(e)
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_keyboard_interrupt(excinfo):
     """Standard pytest hook to handle keyboard interrupts. We only set
@@ -87,15 +107,6 @@ def pytest_sessionstart(session):
     addfinalizer_old = _pytest.fixtures.FixtureRequest.addfinalizer
 
     def addfinalizer_new(self, finalizer):
-        def finalizer_wrapped():
-            try:
-                finalizer()
-            except Exception as e:
-                if not keyboard_interrupt:
-                    raise e
-
-                global_logger.error(e)
-
-        addfinalizer_old(self, finalizer_wrapped)
+        addfinalizer_old(self, _SafeFinalizer(finalizer))
 
     _pytest.fixtures.FixtureRequest.addfinalizer = addfinalizer_new
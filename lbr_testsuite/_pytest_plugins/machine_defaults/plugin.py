@@ -26,6 +26,8 @@ global_logger = logging.getLogger(__name__)
 
 DEFAULT_MACHINE_NAME = "DEFAULT"
 
+_DASH_TO_UNDERSCORE = str.maketrans("-", "_")
+
 
 def pytest_addoption(parser):
     """Standard pytest hook to handle command line or `pytest.ini`
@@ -177,18 +179,14 @@ def get_command_line_option_names(cmd_options):
 
     Returns
     ----------
-    tuple(str)
+    frozenset(str)
         Extracted option names.
     """
 
-    option_names = []
-    for cmd_option in cmd_options:
-        option_name = cmd_option.split("=")[0]
-        option_name = option_name.strip("-")
-        option_name = option_name.replace("-", "_")
-        option_names.append(option_name)
-
-    return option_names
+    return frozenset(
+        cmd_option.partition("=")[0].lstrip("-").translate(_DASH_TO_UNDERSCORE)
+        for cmd_option in cmd_options
+    )
 
 
 def inject_machine_option(config, option, value):
@@ -6,18 +6,13 @@ Copyright: (C) 2021-2024 CESNET, z.s.p.o.
 Pytest plugin with profiler fixtures.
 """
 
-from pypapi import events
+import functools
+
 from pytest_cases import fixture
 
 from ...common.common import compose_output_path
-from ...profiling.cache import PAPIProfiler
-from ...profiling.cpumon import CPUMonProfiler
 from ...profiling.perf import Perf, PerfC2C, PerfMem, PerfStat
-from ...profiling.pipeline import PipelineMonProfiler
-from ...profiling.power_consumption import pyJoulesProfiler
 from ...profiling.profiler import MultiProfiler
-from ...profiling.rx_tx import RxTxMonProfiler
-from ...profiling.system import IrqMonProfiler
 
 
 def pytest_addoption(parser):
@@ -142,124 +137,120 @@ def pytest_addoption(parser):
     )
 
 
+def _sampling_period(name, value):
+    if value <= 0:
+        raise Exception(f"invalid scaling-period for {name}: {value}")
+
+    return value
+
+
+def _make_perf(perf_class, basename, args, output_path):
+    return perf_class(output_path(basename, ".data"), args=args.split(" "))
+
+
+def _make_pyjoules(numa_sockets, output_path):
+    from ...profiling.power_consumption import pyJoulesProfiler
+
+    if numa_sockets == "auto":
+        numa_sockets = None  # auto-detection
+    else:
+        numa_sockets = [int(s) for s in numa_sockets.split(",")]
+
+    csv_file = output_path("pyJoules", ".csv")
+    charts_file = output_path("pyJoules", ".html")
+    return pyJoulesProfiler(csv_file, charts_file, numa_sockets=numa_sockets)
+
+
+def _make_cpumon(time_step, output_path):
+    from ...profiling.cpumon import CPUMonProfiler
+
+    time_step = _sampling_period("cpumon", time_step)
+    csv_file_pattern = output_path("cpumon_{0}", ".csv")
+    charts_file_pattern = output_path("cpumon_{0}", ".html")
+    return CPUMonProfiler(csv_file_pattern, charts_file_pattern, time_step=time_step)
+
+
+def _make_pipelinemon(time_step, output_path):
+    from ...profiling.pipeline import PipelineMonProfiler
+
+    time_step = _sampling_period("pipelinemon", time_step)
+    csv_file_pattern = output_path("pipelinemon_{0}", ".csv")
+    mark_file = output_path("pipelinemon", ".mark")
+    charts_file_pattern = output_path("pipelinemon_{0}_{1}", ".html")
+    return PipelineMonProfiler(
+        csv_file_pattern, mark_file, charts_file_pattern, time_step=time_step
+    )
+
+
+def _make_rxtxmon(time_step, output_path):
+    from ...profiling.rx_tx import RxTxMonProfiler
+
+    time_step = _sampling_period("rxtxmon", time_step)
+    csv_file = output_path("rxtxmon", ".csv")
+    mark_file = output_path("rxtxmon", ".mark")
+    charts_file = output_path("rxtxmon", ".html")
+    return RxTxMonProfiler(csv_file, mark_file, charts_file, time_step=time_step)
+
+
+def _make_irqmon(time_step, output_path):
+    from ...profiling.system import IrqMonProfiler
+
+    time_step = _sampling_period("irqmon", time_step)
+    csv_file = output_path("irqmon", ".csv")
+    charts_file = output_path("irqmon", ".html")
+    return IrqMonProfiler(csv_file, charts_file, time_step=time_step)
+
+
+@functools.cache
+def _papi_event_groups():
+    # Built once per session, pypapi is imported on first use only.
+    from pypapi import events
+
+    return {
+        "L1 Misses": (events.PAPI_L1_DCM, events.PAPI_L1_ICM),
+        "L2 Hits": (events.PAPI_L2_DCH, events.PAPI_L2_ICH),
+        "L2 Misses": (events.PAPI_L2_DCM, events.PAPI_L2_ICM),
+        "L3 Accesses": (events.PAPI_L3_DCA, events.PAPI_L3_ICA),
+    }
+
+
+def _make_cache_prof(time_step, output_path):
+    from ...profiling.cache import PAPIProfiler
+
+    time_step = _sampling_period("cache_prof", time_step)
+    csv_file = output_path("cache_prof", ".csv")
+    mark_file = output_path("cache_prof", ".mark")
+    charts_file = output_path("cache_prof", ".html")
+    return PAPIProfiler(csv_file, mark_file, charts_file, _papi_event_groups(), time_step=time_step)
+
+
+# Pairs of a profiler option name and a factory creating the profiler
+# from the option value and an output path composer. Profiler backends
+# are imported by the factories, i.e. only when enabled, as some of them
+# are expensive to import (e.g. pypapi loads libpapi).
+_PROFILERS = (
+    ("use_perf", functools.partial(_make_perf, Perf, "perf_std")),
+    ("use_perf_stat", functools.partial(_make_perf, PerfStat, "perf_stat")),
+    ("use_perf_mem", functools.partial(_make_perf, PerfMem, "perf_mem")),
+    ("use_perf_c2c", functools.partial(_make_perf, PerfC2C, "perf_c2c")),
+    ("use_pyJoules", _make_pyjoules),
+    ("use_cpumon", _make_cpumon),
+    ("use_pipelinemon", _make_pipelinemon),
+    ("use_rxtxmon", _make_rxtxmon),
+    ("use_irqmon", _make_irqmon),
+    ("use_cache_prof", _make_cache_prof),
+)
+
+
 def collect_profilers(pyt_request, output_dir):
-    profilers = []
+    options = pyt_request.config.option
+    output_path = functools.partial(compose_output_path, pyt_request, directory=output_dir)
 
-    use_perf = pyt_request.config.getoption("use_perf")
-    if use_perf is not None:
-        args = use_perf.split(" ")
-        data = compose_output_path(pyt_request, "perf_std", ".data", output_dir)
-        profilers.append(Perf(data, args=args))
-
-    use_perf_stat = pyt_request.config.getoption("use_perf_stat")
-    if use_perf_stat is not None:
-        args = use_perf_stat.split(" ")
-        data = compose_output_path(pyt_request, "perf_stat", ".data", output_dir)
-        profilers.append(PerfStat(data, args=args))
-
-    use_perf_mem = pyt_request.config.getoption("use_perf_mem")
-    if use_perf_mem is not None:
-        args = use_perf_mem.split(" ")
-        data = compose_output_path(pyt_request, "perf_mem", ".data", output_dir)
-        profilers.append(PerfMem(data, args=args))
-
-    use_perf_c2c = pyt_request.config.getoption("use_perf_c2c")
-    if use_perf_c2c is not None:
-        args = use_perf_c2c.split(" ")
-        data = compose_output_path(pyt_request, "perf_c2c", ".data", output_dir)
-        profilers.append(PerfC2C(data, args=args))
-
-    use_pyJoules = pyt_request.config.getoption("use_pyJoules")
-    if use_pyJoules:
-        if use_pyJoules == "auto":
-            numa_sockets = None  # auto-detection
-        else:
-            numa_sockets = [int(s) for s in use_pyJoules.split(",")]
-
-        csv_file = compose_output_path(pyt_request, "pyJoules", ".csv", output_dir)
-        charts_file = compose_output_path(pyt_request, "pyJoules", ".html", output_dir)
-        profilers.append(pyJoulesProfiler(csv_file, charts_file, numa_sockets=numa_sockets))
-
-    use_cpumon = pyt_request.config.getoption("use_cpumon")
-    if use_cpumon:
-        if use_cpumon <= 0:
-            raise Exception(f"invalid scaling-period for cpumon: {use_cpumon}")
-
-        csv_file_pattern = compose_output_path(pyt_request, "cpumon_{0}", ".csv", output_dir)
-        charts_file_pattern = compose_output_path(pyt_request, "cpumon_{0}", ".html", output_dir)
-        time_step = use_cpumon
-        profilers.append(CPUMonProfiler(csv_file_pattern, charts_file_pattern, time_step=time_step))
-
-    use_pipelinemon = pyt_request.config.getoption("use_pipelinemon")
-    if use_pipelinemon:
-        if use_pipelinemon <= 0:
-            raise Exception(f"invalid scaling-period for pipelinemon: {use_pipelinemon}")
-
-        csv_file_pattern = compose_output_path(pyt_request, "pipelinemon_{0}", ".csv", output_dir)
-        mark_file = compose_output_path(pyt_request, "pipelinemon", ".mark", output_dir)
-        charts_file_pattern = compose_output_path(
-            pyt_request,
-            "pipelinemon_{0}_{1}",
-            ".html",
-            output_dir,
-        )
-        time_step = use_pipelinemon
-        profilers.append(
-            PipelineMonProfiler(
-                csv_file_pattern, mark_file, charts_file_pattern, time_step=time_step
-            )
-        )
-
-    use_rxtxmon = pyt_request.config.getoption("use_rxtxmon")
-    if use_rxtxmon:
-        if use_rxtxmon <= 0:
-            raise Exception(f"invalid scaling-period for rxtxmon: {use_rxtxmon}")
-
-        csv_file = compose_output_path(pyt_request, "rxtxmon", ".csv", output_dir)
-        mark_file = compose_output_path(pyt_request, "rxtxmon", ".mark", output_dir)
-        charts_file = compose_output_path(pyt_request, "rxtxmon", ".html", output_dir)
-        profilers.append(RxTxMonProfiler(csv_file, mark_file, charts_file, time_step=use_rxtxmon))
-
-    use_irqmon = pyt_request.config.getoption("use_irqmon")
-    if use_irqmon:
-        if use_irqmon <= 0:
-            raise Exception(f"invalid scaling-period for irqmon: {use_irqmon}")
-
-        csv_file = compose_output_path(pyt_request, "irqmon", ".csv", output_dir)
-        charts_file = compose_output_path(pyt_request, "irqmon", ".html", output_dir)
-        time_step = use_irqmon
-        profilers.append(IrqMonProfiler(csv_file, charts_file, time_step=time_step))
-
-    use_cache_prof = pyt_request.config.getoption("use_cache_prof")
-    if use_cache_prof:
-        if use_cache_prof <= 0:
-            raise Exception(f"invalid scaling-period for irqmon: {use_cache_prof}")
-
-        csv_file = compose_output_path(pyt_request, "cache_prof", ".csv", output_dir)
-        mark_file = compose_output_path(pyt_request, "cache_prof", ".mark", output_dir)
-        charts_file = compose_output_path(pyt_request, "cache_prof", ".html", output_dir)
-        time_step = use_cache_prof
-        papi_evs = {
-            "L1 Misses": [
-                events.PAPI_L1_DCM,
-                events.PAPI_L1_ICM,
-            ],
-            "L2 Hits": [
-                events.PAPI_L2_DCH,
-                events.PAPI_L2_ICH,
-            ],
-            "L2 Misses": [
-                events.PAPI_L2_DCM,
-                events.PAPI_L2_ICM,
-            ],
-            "L3 Accesses": [
-                events.PAPI_L3_DCA,
-                events.PAPI_L3_ICA,
-            ],
-        }
-        profilers.append(
-            PAPIProfiler(csv_file, mark_file, charts_file, papi_evs, time_step=time_step),
-        )
+    profilers = []
+    for option, make_profiler in _PROFILERS:
+        value = getattr(options, option)
+        if value is not None:
+            profilers.append(make_profiler(value, output_path))
 
     return profilers
 
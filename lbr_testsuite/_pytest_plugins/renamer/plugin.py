@@ -35,10 +35,12 @@ def pytest_collection_modifyitems(session, config, items):
     line arguments.
     """
 
-    prefix = config.getoption("renamer_prefix")
+    # trailing slashes are dropped, the separator is added below
+    prefix = (config.getoption("renamer_prefix") or "").rstrip("/")
 
-    if not prefix or len(prefix) == 0:
+    if not prefix or not items:
         return
 
+    prefix = f"{prefix}/"
     for item in items:
-        item._nodeid = prefix + "/" + item._nodeid
+        item._nodeid = prefix + item._nodeid
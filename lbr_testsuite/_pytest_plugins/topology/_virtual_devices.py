@@ -54,8 +54,7 @@ def topology_vdev_loopback(request, require_root, option_vdevs):
     ipconf.ifc_up(vethpeers[0])
     request.addfinalizer(lambda: ipconf.ifc_down(vethpeers[0]))
 
-    sysctl_set(f"net.ipv6.conf.{vethpeers[0]}.disable_ipv6", "1")
-    sysctl_set(f"net.ipv6.conf.{vethpeers[1]}.disable_ipv6", "1")
+    sysctl_set([f"net.ipv6.conf.{peer}.disable_ipv6" for peer in vethpeers], ["1"] * len(vethpeers))
 
     device = PcapLiveDevice(vethpeers[0])
     generator = NetdevGenerator(vethpeers[1])
@@ -12,9 +12,144 @@ import re
 from ..executable import executable
 
 
+PROC_SYS_DIR = "/proc/sys"
+
+# Only single integer values are supported. Both the direct read and
+# the sysctl tool output have to match it.
+_VALUE_PATTERN = "[0-9]+"
+_VALUE_RE = re.compile(_VALUE_PATTERN)
+
+
+def _proc_sys_path(variable):
+    """Get path of a kernel variable file within the /proc/sys directory.
+
+    Parameters
+    ----------
+    variable : str
+        Variable name.
+
+    Returns
+    -------
+    str
+        Path of a variable file.
+    """
+
+    return os.path.join(PROC_SYS_DIR, *variable.split("."))
+
+
+def _proc_sys_direct_access(netns):
+    """Check whether a kernel variable can be accessed directly via
+    /proc/sys instead of running the sysctl tool.
+
+    Direct access is possible only for variables of the current
+    network namespace and only if we run as root (otherwise sudo is
+    required for writing).
+
+    Parameters
+    ----------
+    netns : str
+        Network namespace name.
+
+    Returns
+    -------
+    bool
+        True if direct access is possible, False otherwise.
+    """
+
+    return netns is None and os.geteuid() == 0
+
+
+def _proc_sys_write(assignments):
+    """Set kernel variables by writing directly to /proc/sys files.
+
+    Parameters
+    ----------
+    assignments : list(tuple(str, str))
+        List of variable name and value pairs.
+
+    Returns
+    -------
+    bool
+        True if all variables were set successfully, False otherwise.
+    """
+
+    try:
+        for var, val in assignments:
+            with open(_proc_sys_path(var), "w") as f:
+                f.write(str(val))
+    except OSError:
+        return False
+
+    return True
+
+
+def _proc_sys_read(variable):
+    """Get kernel variable by reading directly its /proc/sys file.
+
+    Parameters
+    ----------
+    variable : str
+        Variable name.
+
+    Returns
+    -------
+    str or None
+        Variable value or None if the variable cannot be read or
+        its value is not a single integer.
+    """
+
+    try:
+        with open(_proc_sys_path(variable)) as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+
+    if not _VALUE_RE.fullmatch(value):
+        return None
+
+    return value
+
+
+def _sysctl_write(assignments, netns=None, failure_verbosity=None):
+    """Set kernel variables using a single sysctl invocation.
+
+    Parameters
+    ----------
+    assignments : list(str)
+        List of assignments in a form "<variable>=<value>".
+    netns : str, optional
+        Network namespace name. If set, a command is executed in
+        a namespace using the "ip netns" command. Default "None".
+    failure_verbosity : str, optional
+        Failure verbosity of this command. For more details see
+        executable.FAILURE_VERBOSITY_LEVELS.
+
+    Returns
+    -------
+    bool
+        True if all variables were set successfully, False otherwise.
+    """
+
+    sudo_required = os.geteuid() != 0
+
+    cmd = executable.Tool(["sysctl", "-w", *assignments], netns=netns, sudo=sudo_required)
+    if failure_verbosity:
+        cmd.set_failure_verbosity(failure_verbosity)
+    cmd.run()
+
+    return cmd.returncode() == 0
+
+
 def sysctl_set(variables, values, netns=None, failure_verbosity=None):
     """Set kernel variable(s) using sysctl tool.
 
+    If running as root and no network namespace is requested,
+    variables are written directly to their /proc/sys files. Otherwise
+    (or if the direct write fails) all variables are set using a single
+    sysctl invocation. Only if it fails (possible with "no-exception"
+    or "silent" failure verbosity), variables are set one by one to
+    determine the count of successfully set variables.
+
     Parameters
     ----------
     variables : list(str) or str
@@ -41,16 +176,23 @@ def sysctl_set(variables, values, netns=None, failure_verbosity=None):
 
     assert len(variables) == len(values)
 
-    variables_set_ok = 0
+    if len(variables) == 0:
+        return 0
 
-    sudo_required = os.geteuid() != 0
+    if _proc_sys_direct_access(netns) and _proc_sys_write(zip(variables, values)):
+        return len(variables)
 
-    for var, val in zip(variables, values):
-        cmd = executable.Tool(["sysctl", "-w", f"{var}={val}"], netns=netns, sudo=sudo_required)
-        if failure_verbosity:
-            cmd.set_failure_verbosity(failure_verbosity)
-        cmd.run()
-        if cmd.returncode() == 0:
+    assignments = [f"{var}={val}" for var, val in zip(variables, values)]
+
+    if _sysctl_write(assignments, netns, failure_verbosity):
+        return len(assignments)
+
+    if len(assignments) == 1:
+        return 0
+
+    variables_set_ok = 0
+    for assignment in assignments:
+        if _sysctl_write([assignment], netns, failure_verbosity):
             variables_set_ok += 1
 
     return variables_set_ok
@@ -59,6 +201,12 @@ def sysctl_set(variables, values, netns=None, failure_verbosity=None):
 def sysctl_get(variables, netns=None, failure_verbosity=None):
     """Get kernel variable(s) using sysctl tool.
 
+    Variables of the current network namespace are read directly from
+    their /proc/sys files. Variables within a network namespace or
+    variables which cannot be read directly are read using a single
+    sysctl invocation. Only variables with a single integer value are
+    supported.
+
     Parameters
     ----------
     variables : list(str) or str
@@ -84,25 +232,38 @@ def sysctl_get(variables, netns=None, failure_verbosity=None):
     if type(variables) is str:
         variables = [variables]
 
-    values = []
+    values = {}
+    tool_variables = []
 
     for var in variables:
-        var_re = var.replace(".", "\\.")
-        var_re = rf"^{var_re}\s*=\s*([0-9])+$"
+        if netns is None:
+            val = _proc_sys_read(var)
+            if val is not None:
+                values[var] = val
+                continue
 
-        cmd = executable.Tool(["sysctl", var], netns=netns)
+        tool_variables.append(var)
+
+    if tool_variables:
+        cmd = executable.Tool(["sysctl", *tool_variables], netns=netns)
         if failure_verbosity:
             cmd.set_failure_verbosity(failure_verbosity)
         stdout, _ = cmd.run()
-        if cmd.returncode() != 0:
-            continue
+        returncode = cmd.returncode()
+
+        for var in tool_variables:
+            var_re = var.replace(".", "\\.")
+            var_re = rf"^{var_re}\s*=\s*({_VALUE_PATTERN})$"
 
-        match = re.match(var_re, stdout)
-        if not match:
-            raise RuntimeError(f"Unable to match {var} kernel variable.")
-        values.append(match[1])
+            match = re.search(var_re, stdout, re.MULTILINE)
+            if not match:
+                if returncode != 0:
+                    # Failure of this variable was allowed by failure_verbosity
+                    continue
+                raise RuntimeError(f"Unable to match {var} kernel variable.")
+            values[var] = match[1]
 
-    return values
+    return [values[var] for var in variables if var in values]
 
 
 def sysctl_set_with_restore(pyt_request, variables, values, netns=None, failure_verbosity=None):
@@ -176,6 +176,7 @@ class DataTableCharts:
     ):
         self._charts = charts if charts is not None else []
         self._df = None
+        self._data_table = None  # deprecated
         self._old_version = False  # deprecated
 
         self._n_rows = None
@@ -188,9 +189,12 @@ class DataTableCharts:
 
         if isinstance(data_table, DataTable):
             # DataTable is deprecated, used pd.DataFrame instead
-            self._df = data_table.get_data()
+            # Data are retrieved when charts are created so rows appended
+            # to the table in the meantime are plotted too.
+            self._data_table = data_table
             self._old_version = True
         else:
+            self._data_table = None
             self._df = data_table
 
     def append_charts_row(self, charts: List[PlotSpec]):
@@ -390,6 +394,9 @@ class DataTableCharts:
             by the Figure.savefig method.
         """
 
+        if self._data_table is not None:
+            self._df = self._data_table.get_data()
+
         fig, axes = self._prepare_layout()
 
         for i in range(self._n_rows):
@@ -36,15 +36,57 @@ class DataTable:
         else:
             self._df = pandas.DataFrame(columns=init_data)
 
+        # Appended rows are collected here and merged into the DataFrame
+        # only when the data are accessed. Enlarging a DataFrame row by
+        # row copies all its data on every append.
+        self._pending_rows = []
+
+    def _merge_pending_rows(self):
+        if not self._pending_rows:
+            return
+
+        first_row = len(self._df.index)
+        new_rows = pandas.DataFrame(
+            self._pending_rows,
+            columns=self._df.columns,
+            index=range(first_row, first_row + len(self._pending_rows)),
+        )
+        if self._df.empty:
+            self._df = self._cast_to_initial_dtypes(new_rows)
+        else:
+            self._df = pandas.concat([self._df, new_rows])
+
+        self._pending_rows = []
+
+    def _cast_to_initial_dtypes(self, new_rows):
+        # Column types set explicitly on construction are kept. Columns
+        # without a type (object) or with values not convertible to
+        # the type keep types inferred from the values.
+        for column, dtype in self._df.dtypes.items():
+            if dtype == object:
+                continue
+
+            try:
+                new_rows[column] = new_rows[column].astype(dtype)
+            except (ValueError, TypeError):
+                pass
+
+        return new_rows
+
     def get_data(self) -> pandas.DataFrame:
         """Return stored data.
 
+        Note: Returned DataFrame is not updated by rows appended
+        afterwards. Call this method again to get data including
+        such rows.
+
         Returns
         -------
         pandas.DataFrame
             Data stored within the DataTable.
         """
 
+        self._merge_pending_rows()
         return self._df
 
     def empty(self) -> bool:
@@ -56,7 +98,7 @@ class DataTable:
             False when data table contains some data, True otherwise.
         """
 
-        return self._df.empty
+        return self._df.empty and not self._pending_rows
 
     def get_column_unique_values(self, column: str) -> list:
         """Get all unique values from single column.
@@ -72,6 +114,7 @@ class DataTable:
             Unique values returned from selected column.
         """
 
+        self._merge_pending_rows()
         return list(self._df[column].unique())
 
     def _column_is_numeric(self, key: str) -> bool:
@@ -92,6 +135,7 @@ class DataTable:
         return " & ".join(sub_q)
 
     def _filter_data_frame(self, filter_by: dict) -> pandas.DataFrame:
+        self._merge_pending_rows()
         filter_query = self._filter_to_query(filter_by)
         return self._df.query(filter_query)
 
@@ -122,10 +166,17 @@ class DataTable:
         ----------
         row : tuple
             Tuple of values to write..
+
+        Raises
+        ------
+        ValueError
+            If count of values does not match count of columns.
         """
 
-        current_row = len(self._df.index)
-        self._df.loc[current_row] = row
+        if len(row) != len(self._df.columns):
+            raise ValueError("cannot set a row with mismatched columns")
+
+        self._pending_rows.append(row)
 
     def store_csv(self, csv_file: Union[str, pathlib.Path], filter_by: Optional[dict] = None):
         """Store data from data table to CSV file.
@@ -140,6 +191,7 @@ class DataTable:
             stored. None by default (i.e. save all data).
         """
 
+        self._merge_pending_rows()
         data = self._df
         if filter_by:
             data = self._filter_data_frame(filter_by)
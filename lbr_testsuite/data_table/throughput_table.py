@@ -69,6 +69,7 @@ class ThroughputTable:
         self._value_cols = value_columns
         self._index_cols = [self.PACKET_LENGTH_COLUMN] + index_columns
         self._cols = self._index_cols + self._value_cols
+        self._cols_set = frozenset(self._cols)
 
         self._df_last = None
 
@@ -105,7 +106,7 @@ class ThroughputTable:
             Dictionary with keys matching all index and value columns.
         """
 
-        assert set(row.keys()) == set(self._index_cols + self._value_cols), "Missing some column(s)"
+        assert row.keys() == self._cols_set, "Missing some column(s)"
         self._data.append(row)
 
     def values_to_numeric(self):
@@ -119,28 +120,31 @@ class ThroughputTable:
         for col in self._cols:
             conv_type = int
             for row in self._data:
-                try:
-                    # first try int, as float cant be converted to int in this way
-                    int(row[col])
-                except ValueError:
-                    # every value which can be converted to int can be converted to float also
-                    conv_type = float
+                if conv_type is int:
                     try:
-                        float(row[col])
+                        # first try int, as float cant be converted to int in this way
+                        int(row[col])
+                        continue
                     except ValueError:
-                        # no conversion - keep value original type
-                        conv_type = None
-                        break
+                        # every value which can be converted to int can be converted to float also
+                        conv_type = float
+
+                try:
+                    float(row[col])
+                except ValueError:
+                    # no conversion - keep value original type
+                    conv_type = None
+                    break
 
             if conv_type:
                 conv_table[col] = conv_type
 
         for row in self._data:
-            for col in row.keys():
-                try:
-                    row[col] = conv_table[col](row[col])
-                except KeyError:
-                    pass
+            for col, conv_type in conv_table.items():
+                row[col] = conv_type(row[col])
+
+        # Values have changed, DataFrame has to be created again
+        self._df_last = None
 
     def load_rows(self, csv_file: Union[str, pathlib.Path], convert_numeric: bool = True):
         """Load data rows from CSV file.
@@ -161,7 +165,7 @@ class ThroughputTable:
 
         with open(str(csv_file)) as csvfile:
             reader = csv.DictReader(csvfile)
-            if set(reader.fieldnames) != set(self._cols):
+            if set(reader.fieldnames) != self._cols_set:
                 raise RuntimeError(
                     "Non-matching set of columns in data file and throughput table:\n"
                     f"file : {reader.fieldnames},\n"
@@ -391,9 +391,12 @@ class Executable:
             assert (
                 self._failure_verbosity == "no-error" or self._failure_verbosity == "no-exception"
             )
-            self._logger.debug(fail_msg)
-            self._logger.debug(f"Captured stdout:\n{stdout}")
-            self._logger.debug(f"Captured stderr:\n{stderr}")
+            # Failures allowed by the caller are expected to be frequent
+            # (e.g. probing), so do not format outputs unless needed.
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    f"{fail_msg}\nCaptured stdout:\n{stdout}\nCaptured stderr:\n{stderr}"
+                )
 
         if self._failure_verbosity == "normal" or self._failure_verbosity == "no-error":
             raise ExecutableProcessError(process_retcode, process_cmd)
@@ -156,8 +156,7 @@ class LocalExecutor(Executor):
         if self._used_sudo:
             # In case process was started with explicit sudo prefix
             subprocess.run(
-                f"sudo kill -s SIGTERM {self._process.pid}",
-                shell=True,
+                ["sudo", "kill", "-s", "SIGTERM", str(self._process.pid)],
                 check=True,
             )
         else:
@@ -273,8 +272,7 @@ class LocalExecutor(Executor):
                 if self._used_sudo:
                     # In case process was started with explicit sudo prefix
                     subprocess.run(
-                        f"sudo kill -s SIGKILL {self._process.pid}",
-                        shell=True,
+                        ["sudo", "kill", "-s", "SIGKILL", str(self._process.pid)],
                         check=True,
                     )
                 else:
@@ -178,15 +178,8 @@ class Rsync:
 
         file = Path(self._data_dir) / name
 
-        try:
-            Tool(
-                f"touch {file}",
-                executor=self._executor,
-            ).run()
-        except ExecutableProcessError as err:
-            raise RsyncException(f"Could not create file {name}, err: {err}") from err
-
         if content:
+            # Redirection creates the file, no need to touch it first.
             try:
                 Tool(
                     f"echo {quote(content)} > {file}",
@@ -194,6 +187,14 @@ class Rsync:
                 ).run()
             except ExecutableProcessError as err:
                 raise RsyncException(f"Could not write to file {name}, err: {err}") from err
+        else:
+            try:
+                Tool(
+                    f"touch {file}",
+                    executor=self._executor,
+                ).run()
+            except ExecutableProcessError as err:
+                raise RsyncException(f"Could not create file {name}, err: {err}") from err
 
         return str(file)
 
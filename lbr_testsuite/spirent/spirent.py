@@ -114,6 +114,9 @@ class Spirent(Generator):
         self._port_reserved = False
         self._force_port_reservation = force_port_reservation
         self._link_wait_timeout = link_wait_timeout
+        # Incremented on every configuration load. STC object handlers
+        # obtained for an older configuration are no longer valid.
+        self._config_generation = 0
 
     def set_config_file(self, config_path):
         """Configure STC configuration file.
@@ -126,6 +129,17 @@ class Spirent(Generator):
 
         self._spirent_config = str(config_path)
 
+    def config_generation(self):
+        """Get counter of STC configuration loads.
+
+        Returns
+        -------
+        int
+            Count of configurations loaded so far.
+        """
+
+        return self._config_generation
+
     def get_port(self):
         """Spirent port getter.
 
@@ -153,6 +167,7 @@ class Spirent(Generator):
 
         self._logger.debug(f"Loading STC configuration: {self._spirent_config}.")
         self._stc_handler.stc_init(self._spirent_config)
+        self._config_generation += 1
 
     def _connect_chassis_port(self):
         """Connect to spirent chassis and reserve port.
@@ -527,18 +542,16 @@ class Spirent(Generator):
             otherwise.
         """
 
-        arpnd_ok = []
-        for sb_name in stream_blocks:
-            sb = self._stc_handler.stc_stream_block(sb_name)
-            arpnd_status = self._stc_handler.stc_attribute(sb, "IsArpResolved")[0][0]
-            arpnd_ok.append(arpnd_status.lower())
+        sb_handlers = self._stream_blocks_handler(stream_blocks)
+
+        def arpnd_statuses():
+            arpnd_status = self._stc_handler.stc_attribute(sb_handlers, "IsArpResolved")
+            return [status[0].lower() for status in arpnd_status]
 
-        if "false" in arpnd_ok:
+        if "false" in arpnd_statuses():
             self._stc_handler.stc_start_arpnd()
-            for sb_name in stream_blocks:
-                arpnd_fixed = self._stc_handler.stc_attribute(sb, "IsArpResolved")[0][0]
-                if arpnd_fixed.lower() != "true":
-                    return False
+            if any(status != "true" for status in arpnd_statuses()):
+                return False
 
         return True
 
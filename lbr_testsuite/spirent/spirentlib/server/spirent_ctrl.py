@@ -60,7 +60,7 @@ class STCManager:
             ) from None
 
         if inspect.ismethod(method):
-            self._logger.debug("Calling method {}".format(method_name))
+            self._logger.debug("Calling method %s", method_name)
             return method(*args, **kwargs)
         else:
             raise AttributeError(
@@ -109,7 +109,9 @@ class ConnectionHandler(socketserver.BaseRequestHandler):
         timeout for the socket.
         """
         self._logger = logging.getLogger("Client").getChild("{}".format(self.client_address[1]))
-        self._logger.info("New connection: IP: {}, Port: {}".format(*self.client_address))
+        self._logger.info(
+            "New connection: IP: %s, Port: %s", self.client_address[0], self.client_address[1]
+        )
         self._pipe, proc_pipe = mp.Pipe()
         self._process = mp.Process(target=stc_process, args=(proc_pipe, self._logger.name))
         self._process.start()
@@ -125,7 +127,7 @@ class ConnectionHandler(socketserver.BaseRequestHandler):
                 if type(msg) is not dict:
                     raise TypeError("Received invalid message.")
 
-                self._logger.debug("Received msg: {}".format(msg))
+                self._logger.debug("Received msg: %s", msg)
 
                 if "args" not in msg:
                     msg["args"] = []
@@ -172,7 +174,7 @@ class ConnectionHandler(socketserver.BaseRequestHandler):
         while len(buffer) < msg_len:
             buffer.extend(self._recv(1500))
 
-        self._logger.debug("Received message - {}B".format(4 + len(buffer)))
+        self._logger.debug("Received message - %dB", 4 + len(buffer))
         return pickle.loads(buffer)
 
     def _send_msg(self, msg):
@@ -180,7 +182,7 @@ class ConnectionHandler(socketserver.BaseRequestHandler):
         raw_data = pickle.dumps(msg)
         data = struct.pack("<I", len(raw_data)) + raw_data
         sent = self.request.send(data)
-        self._logger.debug("Sent message - {}B".format(sent))
+        self._logger.debug("Sent message - %dB", sent)
 
 
 class ThreadingTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
@@ -32,15 +32,15 @@ class StcPythonTCP:
         while len(buffer) < msg_len:
             buffer.extend(self._socket.recv(1500))
 
-        self._logger.debug("Received message - {}B".format(len(buffer)))
+        self._logger.debug("Received message - %dB", len(buffer))
         return pickle.loads(buffer)
 
     def _send_msg(self, msg):
-        self._logger.debug("Sending message: {}".format(msg))
+        self._logger.debug("Sending message: %s", msg)
         raw_data = pickle.dumps(msg)
         data = struct.pack("<I", len(raw_data)) + raw_data
         sent = self._socket.send(data)
-        self._logger.debug("Sent message - {}B".format(sent))
+        self._logger.debug("Sent message - %dB", sent)
 
     def _process_command(self, command, args, kwargs):
         self._send_msg({"function": command, "args": args, "kwargs": kwargs})
@@ -36,10 +36,33 @@ class AbstractStreamBlock(ABC):
         self._spirent = spirent
         self._stc_handler = spirent._stc_handler
         self._name = name
+        self._sb_handler = None
+        self._sb_handler_generation = None
 
     def name(self):
         return self._name
 
+    def _handler(self):
+        """Get STC handler of the stream block.
+
+        The handler is looked up on the first use only and it is cached
+        afterwards as each lookup costs several STC API round trips.
+        The cached handler is dropped when a new STC configuration is
+        loaded.
+
+        Returns
+        -------
+        list(list(str))
+            Stream block handler as returned by the STC handler.
+        """
+
+        generation = self._spirent.config_generation()
+        if self._sb_handler is None or self._sb_handler_generation != generation:
+            self._sb_handler = self._stc_handler.stc_stream_block(self._name)
+            self._sb_handler_generation = generation
+
+        return self._sb_handler
+
     @abstractmethod
     def apply(self):
         """Apply the stream block using instance attributes."""
@@ -59,7 +82,7 @@ class AbstractStreamBlock(ABC):
     def _read_stats(self, key: str) -> int:
         """Retrieve streamblock stats with given key."""
 
-        sb_handler = self._stc_handler.stc_stream_block(self._name)
+        sb_handler = self._handler()
         sb_tx = int(self._stc_handler.stc_tx_stream_block_results(sb_handler, key)[0][0])
         sb_rx = int(self._stc_handler.stc_rx_stream_block_results(sb_handler, key)[0][0])
 
@@ -68,7 +91,7 @@ class AbstractStreamBlock(ABC):
     def _read_float_rxstats(self, key: str) -> float:
         """Retrieve RX streamblock floating point stats with given key"""
 
-        sb_handler = self._stc_handler.stc_stream_block(self._name)
+        sb_handler = self._handler()
         sb_stats = float(self._stc_handler.stc_rx_stream_block_results(sb_handler, key)[0][0])
 
         return sb_stats
@@ -85,7 +108,7 @@ class AbstractStreamBlock(ABC):
             True if stream block is active, False otherwise.
         """
 
-        sb_handler = self._stc_handler.stc_stream_block(self._name)
+        sb_handler = self._handler()
 
         sb_active = self._stc_handler.stc_rx_stream_block_results(sb_handler, "Active")[0][0]
         return sb_active == "true"
@@ -107,7 +130,7 @@ class AbstractStreamBlock(ABC):
         else:
             sb_active = "FALSE"
 
-        sb_handler = self._stc_handler.stc_stream_block(self._name)
+        sb_handler = self._handler()
         self._stc_handler.stc_attribute(sb_handler, "Active", sb_active)
 
     def get_tx_rx_stats(self):
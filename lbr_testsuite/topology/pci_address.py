@@ -24,6 +24,10 @@ class PciAddress:
         PCI address function.
     """
 
+    _ADDRESS_RE = re.compile(
+        r"([0-9a-fA-F]{4}):([0-9a-fA-F]{2}):([0-9a-fA-F]{2})\.([0-9a-fA-F]{1})"
+    )
+
     def __init__(self, domain=0, bus=0, devid=0, function=0):
         """PCI address object.
 
@@ -46,8 +50,7 @@ class PciAddress:
 
     @classmethod
     def _parse(cls, address):
-        regexp = r"([0-9a-fA-F]{4}):([0-9a-fA-F]{2}):([0-9a-fA-F]{2}).([0-9a-fA-F]{1})"
-        return re.match(regexp, address)
+        return cls._ADDRESS_RE.match(address)
 
     @classmethod
     def from_string(cls, address):
@@ -55,7 +58,7 @@ class PciAddress:
 
         match = cls._parse(address)
         if not match:
-            raise RuntimeError("Not a valid PCI address ({address})")
+            raise RuntimeError(f"Not a valid PCI address ({address})")
 
         groups = [int(x, 16) for x in match.groups()]
         return cls(*groups)
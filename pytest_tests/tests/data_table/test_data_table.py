@@ -0,0 +1,116 @@
+"""
+Copyright: (C) 2024 CESNET, z.s.p.o.
+
+Testing of DataTable module.
+"""
+
+import pandas
+import pytest
+
+from lbr_testsuite.data_table.benchmark_charts import BenchmarkCharts
+from lbr_testsuite.data_table.charts import DataTableCharts
+from lbr_testsuite.data_table.data_table import DataTable
+
+
+COLUMNS = ("name", "workers", "mbps")
+ROWS = [
+    ("a", 8, 1.5),
+    ("b", 16, 2.5),
+    ("a", 16, 3.5),
+]
+
+
+def _reference_data_frame(rows):
+    df = pandas.DataFrame(columns=COLUMNS)
+    for i, row in enumerate(rows):
+        df.loc[i] = row
+
+    return df
+
+
+def test_data_table_append_row():
+    """Test that rows appended in between of data accesses are stored
+    in order, with continuous index and column types same as when the
+    rows are set directly in a DataFrame.
+    """
+
+    table = DataTable(COLUMNS)
+    assert table.empty()
+
+    table.append_row(ROWS[0])
+    table.append_row(ROWS[1])
+    assert not table.empty()
+
+    filtered = table.filter_data({"name": "b"})
+    pandas.testing.assert_frame_equal(
+        filtered.get_data(),
+        _reference_data_frame(ROWS[:2]).loc[[1]],
+    )
+
+    table.append_row(ROWS[2])
+    data = table.get_data()
+    pandas.testing.assert_frame_equal(data, _reference_data_frame(ROWS))
+    assert list(data.index) == [0, 1, 2]
+    assert list(data["name"]) == ["a", "b", "a"]
+    assert data["workers"].dtype.kind == "i"
+    assert data["mbps"].dtype.kind == "f"
+
+    filtered = table.filter_data({"name": "a"})
+    assert list(filtered.get_data().index) == [0, 2]
+
+
+def test_data_table_append_row_mismatched_columns():
+    """Test that appending a row with a wrong count of values fails."""
+
+    table = DataTable(COLUMNS)
+
+    with pytest.raises(ValueError):
+        table.append_row(ROWS[0][:2])
+
+    assert table.empty()
+
+
+def test_data_table_append_row_keeps_initial_dtypes():
+    """Test that column types of an initial empty DataFrame are kept
+    when rows are appended.
+    """
+
+    init_df = pandas.DataFrame(
+        {
+            "name": pandas.Series(dtype="string"),
+            "workers": pandas.Series(dtype="int32"),
+            "mbps": pandas.Series(dtype="float64"),
+        }
+    )
+    table = DataTable(init_df)
+
+    table.append_row(("a", 8, 1))
+    table.append_row(("b", 16, 2))
+    data = table.get_data()
+
+    pandas.testing.assert_series_equal(data.dtypes, init_df.dtypes)
+    assert list(data["mbps"]) == [1.0, 2.0]
+
+
+def test_data_table_charts_plot_rows_appended_later():
+    """Test that charts plot also rows appended to a data table after
+    the table was set as charts data.
+    """
+
+    table = DataTable(BenchmarkCharts.BASE_COLUMNS_HEADER)
+    table.append_row((64, 10, 20, 100, 1.0, 2.0, 10.0))
+
+    bc = BenchmarkCharts()
+    charts = DataTableCharts()
+    charts.append_charts_row([bc.chart_spec("Mbps", "Mbps"), bc.chart_spec("Mpps", "Mpps")])
+    charts.set_data(table)
+
+    table.append_row((128, 30, 40, 100, 2.0, 3.0, 5.0))
+    table.append_row((256, 50, 60, 100, 3.0, 4.0, 2.5))
+
+    fig = charts.create_charts()
+    for ax in fig.axes:
+        lines = ax.get_lines()
+        assert lines, "No line has been plotted."
+        for line in lines:
+            assert list(line.get_xdata()) == [64, 128, 256]
@@ -64,3 +64,52 @@ def test_sysctl_set_with_restore(request, require_root, testing_namespace):
     sysctl.sysctl_set_with_restore(request, TEST_VAR, set_value)
     curr_value = _sysctl_get_value(TEST_VAR)
     assert curr_value == set_value, f"Unexpected value of {TEST_VAR} after set."
+
+
+INVALID_VAR = "net.ipv6.conf.default.lbr_testsuite_nonexistent"
+OTHER_VAR = "net.ipv4.ip_forward"
+
+
+def test_sysctl_set_partial_failure(request, require_root, testing_namespace):
+    """Test that count of successfully set variables is returned when
+    setting of some variables fails and failures are allowed.
+    """
+
+    netns = testing_namespace
+
+    init_value = sysctl.sysctl_get(TEST_VAR, netns)[0]
+    set_value = _flip_value(init_value)
+    request.addfinalizer(lambda: sysctl.sysctl_set(TEST_VAR, init_value, netns))
+
+    vars_set = sysctl.sysctl_set(
+        [TEST_VAR, INVALID_VAR],
+        [set_value, "1"],
+        netns,
+        failure_verbosity="no-exception",
+    )
+    assert vars_set == 1, "Expected to set exactly one variable"
+    curr_value = sysctl.sysctl_get(TEST_VAR, netns)[0]
+    assert curr_value == set_value, f"Unexpected value of {TEST_VAR} after set."
+
+
+def test_sysctl_get_multiple(require_root, testing_namespace):
+    """Test getting of multiple kernel variables at once, including
+    a variable which fails to be read.
+    """
+
+    netns = testing_namespace
+
+    expected = [
+        sysctl.sysctl_get(TEST_VAR, netns)[0],
+        sysctl.sysctl_get(OTHER_VAR, netns)[0],
+    ]
+
+    values = sysctl.sysctl_get([TEST_VAR, OTHER_VAR], netns)
+    assert values == expected, "Unexpected values of variables got at once."
+
+    values = sysctl.sysctl_get(
+        [TEST_VAR, INVALID_VAR, OTHER_VAR],
+        netns,
+        failure_verbosity="no-exception",
+    )
+    assert values == expected, "Unexpected values of variables with a failing one."
@@ -9,6 +9,7 @@ import os
 from enum import StrEnum
 from pathlib import Path
 
+import pandas as pd
 import pytest
 from pytest_cases import fixture, parametrize
 
@@ -156,3 +157,27 @@ def test_throughput(
             throughput_table.VALUE_COLUMN.MAX_MPPS: mbps_to_mpps(max_throughput, packet_length),
         }
     )
+
+
+def test_values_to_numeric_refreshes_df():
+    """Test that DataFrame read before conversion of values to numeric
+    types is not reused after the conversion.
+    """
+
+    table = throughput_table.ThroughputTable(
+        value_columns=[EXP_THROUGHPUT_COLUMN],
+        index_columns=["driver", "workers"],
+    )
+    table.load_rows(
+        Path(__file__).parent.resolve() / "expected_throughput.csv",
+        convert_numeric=False,
+    )
+
+    assert table.df[EXP_THROUGHPUT_COLUMN].dtype == object
+
+    table.values_to_numeric()
+
+    df = table.df
+    assert pd.api.types.is_integer_dtype(df[EXP_THROUGHPUT_COLUMN])
+    assert pd.api.types.is_integer_dtype(df.index.get_level_values("workers"))
+    assert pd.api.types.is_integer_dtype(df.index.get_level_values(table.PACKET_LENGTH_COLUMN))